@@ -1,25 +1,56 @@
 from typing import List, Dict
 
+import numpy as np
+
+try:
+    from numba import float64, njit
+except ImportError:  # numba is optional — fall back to numpy.vdot
+    _dot = np.vdot
+else:
+    # Eager signature: compiled once at import, no first-call JIT latency.
+    @njit(float64(float64[:], float64[:]), cache=True)
+    def _dot(q, p):
+        s = 0.0
+        for i in range(q.shape[0]):
+            s += q[i] * p[i]
+        return s
+
+
+def _quantities(balances: List[Dict]) -> np.ndarray:
+    return np.fromiter(
+        (float(a.get("free", 0)) + float(a.get("locked", 0)) for a in balances),
+        dtype=np.float64,
+        count=len(balances),
+    )
+
 
 def calculate_portfolio_value(balances: List[Dict], prices: Dict[str, float]) -> float:
     """
     Calculate total portfolio value in USDT.
     """
-    total = 0.0
-
-    for asset in balances:
-        free = float(asset.get("free", 0))
-        locked = float(asset.get("locked", 0))
-        qty = free + locked
+    get = prices.get
+    px = np.fromiter(
+        (1.0 if s == "USDT" else get(s + "USDT", 0.0) for s in (a["asset"] for a in balances)),
+        dtype=np.float64,
+        count=len(balances),
+    )
 
-        symbol = asset["asset"]
+    return float(_dot(_quantities(balances), px))
 
-        if symbol == "USDT":
-            total += qty
-        elif f"{symbol}USDT" in prices:
-            total += qty * prices[f"{symbol}USDT"]
 
-    return total
+def calculate_portfolio_value_fast(balances: List[Dict], prices_by_base: Dict[str, float]) -> float:
+    """
+    Calculate total portfolio value in USDT from prices keyed by base asset
+    (e.g. {"BTC": 67000.0}), skipping the per-asset symbol concatenation.
+    """
+    get = prices_by_base.get
+    px = np.fromiter(
+        (1.0 if s == "USDT" else get(s, 0.0) for s in (a["asset"] for a in balances)),
+        dtype=np.float64,
+        count=len(balances),
+    )
+
+    return float(_dot(_quantities(balances), px))
 
 
 def calculate_pnl(current_value: float, initial_value: float = 10000) -> float:
@@ -0,0 +1,109 @@
+"""
+Vectorized validation for many orders at once.
+
+Kept apart from validators.py, which is compiled with mypyc, so that the
+pandas/NumPy dependency stays optional and out of the typed build.
+"""
+
+from __future__ import annotations
+
+from bot.validators import (
+    VALID_ORDER_TYPES,
+    VALID_SIDES,
+    _PRICE_REQUIRED_TYPES,
+    _STOP_REQUIRED_TYPES,
+    _VALID_ORDER_TYPES_MSG,
+    _VALID_SIDES_MSG,
+    ValidationError,
+    _parse_positive,
+)
+
+
+def validate_all_batch(
+    symbols,
+    sides,
+    order_types,
+    quantities,
+    prices=None,
+    stop_prices=None,
+) -> dict:
+    """
+    Vectorized ``validate_all`` over many orders at once.
+
+    Takes equal-length sequences (lists, NumPy arrays or pandas Series) and
+    returns a dict of NumPy arrays holding what ``validate_all`` returns per row:
+    canonical strings for symbol/side/order_type and fixed-point wire text for
+    quantity/price/stop_price (None where no price is given). Raises
+    ValidationError listing the offending row indices.
+    """
+    # Imported lazily so the CLI's single-order path stays light.
+    import numpy as np
+    import pandas as pd
+
+    def _check(bad, what: str) -> None:
+        bad = np.asarray(bad, dtype=bool)
+        if bad.any():
+            raise ValidationError(f"Rows {np.flatnonzero(bad).tolist()}: {what}.")
+
+    def _clean(values):
+        return pd.Series(values, dtype="string").str.strip().str.upper()
+
+    # Check alignment first: row errors on misaligned columns would be misleading.
+    n = len(symbols)
+    for name, values in (("sides", sides), ("order_types", order_types),
+                         ("quantities", quantities), ("prices", prices),
+                         ("stop_prices", stop_prices)):
+        if values is not None and len(values) != n:
+            raise ValidationError(f"{name} must have the same length as symbols ({n}).")
+
+    sym = _clean(symbols)
+    _check(~sym.str.fullmatch(r"[A-Z0-9]{3,20}").fillna(False),
+           "invalid symbol, expected uppercase alphanumeric (e.g. BTCUSDT)")
+
+    side = _clean(sides)
+    _check(~side.isin(list(VALID_SIDES)), f"invalid side, must be one of: {_VALID_SIDES_MSG}")
+
+    ot = _clean(order_types)
+    _check(~ot.isin(list(VALID_ORDER_TYPES)),
+           f"invalid order type, must be one of: {_VALID_ORDER_TYPES_MSG}")
+
+    def _numeric(values, field_name: str, required, required_msg: str):
+        if values is None:
+            raw = pd.Series([None] * n, dtype="string")
+        else:
+            raw = pd.Series(values, dtype="string").str.strip()
+
+        missing = (raw.isna() | (raw == "")).to_numpy(dtype=bool)
+        _check(missing & required, required_msg)
+
+        # Plain ASCII decimals, the usual case, only need leading zeros
+        # trimmed to match validate_all's fixed-point text. Anything else
+        # (signs, exponents, ".5", non-ASCII digits) goes through the same
+        # Decimal parser as validate_all, one row at a time.
+        text = raw.fillna("")
+        plain = text.str.fullmatch(r"[0-9]+(\.[0-9]+)?").to_numpy(dtype=bool)
+        bad = plain & text.str.fullmatch(r"[0.]+").to_numpy(dtype=bool)
+        out = text.str.replace(r"^0+(?=[0-9])", "", regex=True).to_numpy(dtype=object)
+        for i in np.flatnonzero(~plain & ~missing):
+            try:
+                out[i] = _parse_positive(out[i], field_name)
+            except ValidationError:
+                bad[i] = True
+        _check(bad, f"invalid {field_name}, must be a positive number")
+        out[missing] = None
+        return out
+
+    ot_arr = ot.to_numpy(dtype=str)
+    needs_price = np.isin(ot_arr, list(_PRICE_REQUIRED_TYPES))
+    needs_stop = np.isin(ot_arr, list(_STOP_REQUIRED_TYPES))
+
+    return {
+        "symbol":     sym.to_numpy(dtype=str),
+        "side":       side.to_numpy(dtype=str),
+        "order_type": ot_arr,
+        "quantity":   _numeric(quantities, "quantity", True, "quantity is required"),
+        "price":      _numeric(prices, "price", needs_price,
+                               "price is required for LIMIT and STOP_LIMIT orders"),
+        "stop_price": _numeric(stop_prices, "stop price", needs_stop,
+                               "stop price is required for STOP_MARKET and STOP_LIMIT orders"),
+    }
@@ -185,15 +185,6 @@ def account():
 
     balances = account.get("balances", [])
 
-    rows = []
-    for b in balances:
-        free = float(b["free"])
-        locked = float(b["locked"])
-        total = free + locked
-
-        if total > 0:
-            rows.append((b["asset"], free, locked, total))
-
     table = Table(
         box=box.SIMPLE_HEAD,
         header_style="bold cyan",
@@ -205,13 +196,18 @@ def account():
     table.add_column("Locked", justify="right")
     table.add_column("Total", justify="right")
 
-    for asset, free, locked, total in rows:
-        table.add_row(
-            asset,
-            f"{free:.6f}",
-            f"{locked:.6f}",
-            f"[bold]{total:.6f}[/]",
-        )
+    for b in balances:
+        free = float(b["free"])
+        locked = float(b["locked"])
+        total = free + locked
+
+        if total > 0:
+            table.add_row(
+                b["asset"],
+                f"{free:.6f}",
+                f"{locked:.6f}",
+                f"[bold]{total:.6f}[/]",
+            )
 
     console.print(Panel(
         table,
@@ -7,14 +7,24 @@ automatic timestamp sync, and graceful error handling.
 
 from __future__ import annotations
 
-import hashlib
 import hmac
+import json
+import logging
+import string
+import threading
 import time
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional — fall back to the stdlib parser
+    _json_loads = json.loads
 
 from logging_config import get_logger
 
@@ -22,6 +32,32 @@ logger = get_logger(__name__)
 
 BASE_URL = "https://testnet.binance.vision"
 RECV_WINDOW = 5000
+SERVER_TIME_TTL = 60  # seconds between serverTime re-syncs
+
+# Pre-rendered query shapes for the common order types. Values are inserted
+# unescaped, so callers must check them with _is_wire_safe first. timestamp
+# and recvWindow are appended by _request at signing time.
+_MARKET_TMPL = "symbol={symbol}&side={side}&type=MARKET&quantity={qty}"
+_LIMIT_TMPL = (
+    "symbol={symbol}&side={side}&type=LIMIT&timeInForce={tif}"
+    "&quantity={qty}&price={px}"
+)
+
+# Characters urlencode() leaves untouched; anything else needs quoting.
+_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "_.-~")
+
+
+def _is_wire_safe(*values: str) -> bool:
+    """True if every value can go into a query string without escaping."""
+    return all(_SAFE_CHARS.issuperset(v) for v in values)
+
+
+def _fast_encode(pairs: Iterable[Tuple[str, Any]]) -> str:
+    """Join query pairs directly, falling back to urlencode if a value needs escaping."""
+    pairs = [(k, str(v)) for k, v in pairs]
+    if _is_wire_safe(*(v for _, v in pairs)):
+        return "&".join(k + "=" + v for k, v in pairs)
+    return urlencode(pairs)
 
 
 class BinanceAPIError(Exception):
@@ -45,32 +81,70 @@ class BinanceClient:
         self.api_secret = api_secret
         self.base_url = base_url.rstrip("/")
 
+        self._secret_bytes = self.api_secret.encode("utf-8")
+
+        # Local → Binance clock offset, refreshed every SERVER_TIME_TTL seconds.
+        self._server_offset_ms = 0
+        self._offset_refreshed_at = float("-inf")
+        self._offset_lock = threading.Lock()
+
         self.session = requests.Session()
         self.session.headers.update(
             {
                 "X-MBX-APIKEY": self.api_key,
                 "Content-Type": "application/x-www-form-urlencoded",
                 "User-Agent": "TradingBot/1.0",
+                "Connection": "keep-alive",
             }
         )
 
+        # Keep warm connections across calls. Retry only covers urllib3's
+        # idempotent methods, so a POST /order is never resent.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.1,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+
         logger.debug("BinanceClient initialized | base_url=%s", self.base_url)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _sign(self, params: Dict[str, Any]) -> str:
-        query = urlencode(params)
-        signature = hmac.new(
-            self.api_secret.encode("utf-8"),
-            query.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
-        return signature
+    def _sign(self, query: bytes) -> str:
+        """HMAC-SHA256 hex signature of an already-encoded query string."""
+        return hmac.digest(self._secret_bytes, query, "sha256").hex()
 
     def _timestamp(self) -> int:
-        return int(time.time() * 1000)
+        if time.monotonic() - self._offset_refreshed_at > SERVER_TIME_TTL:
+            # Concurrent callers wait here rather than sign with a stale
+            # offset; the refresh time is only recorded once the sync is done.
+            with self._offset_lock:
+                if time.monotonic() - self._offset_refreshed_at > SERVER_TIME_TTL:
+                    self._sync_server_time()
+                    self._offset_refreshed_at = time.monotonic()
+        return time.time_ns() // 1_000_000 + self._server_offset_ms
+
+    def _sync_server_time(self) -> None:
+        """Measure the local clock's skew against Binance ``serverTime``."""
+        try:
+            before = time.time_ns() // 1_000_000
+            server_ms = self._request("GET", "/api/v3/time")["serverTime"]
+            after = time.time_ns() // 1_000_000
+        except Exception as exc:
+            logger.warning("Server time sync failed, keeping offset %dms: %s",
+                           self._server_offset_ms, exc)
+            return
+
+        self._server_offset_ms = server_ms - (before + after) // 2
+        logger.debug("Server time synced | offset=%dms", self._server_offset_ms)
 
     def _request(
         self,
@@ -79,43 +153,66 @@ class BinanceClient:
         signed: bool = False,
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
+        query: Optional[str] = None,
     ) -> Dict[str, Any]:
+        """
+        Send a request and return the decoded JSON body.
+
+        ``query`` is a ready-to-send field string for signed requests, built
+        by _fast_encode or from a template whose values passed _is_wire_safe.
+        When given it is signed as-is instead of encoding ``params``/``data``.
+        """
 
         url = f"{self.base_url}{endpoint}"
         params = params or {}
         data = data or {}
 
         if signed:
-            payload = {
-                **params,
-                **data,
-                "timestamp": self._timestamp(),
-                "recvWindow": RECV_WINDOW,
-            }
-
-            payload["signature"] = self._sign(payload)
+            if query is not None:
+                query = f"{query}&timestamp={self._timestamp()}&recvWindow={RECV_WINDOW}"
+            else:
+                payload = {
+                    **params,
+                    **data,
+                    "timestamp": self._timestamp(),
+                    "recvWindow": RECV_WINDOW,
+                }
+                query = _fast_encode(payload.items())
+
+            # Encode once: the signed bytes are exactly what goes on the wire.
+            signed_query = query.encode("utf-8")
+            signed_query += b"&signature=" + self._sign(signed_query).encode("ascii")
 
             if method.upper() in ("GET", "DELETE"):
-                params = payload
-                data = {}
+                req_params, req_body = signed_query, None
             else:
-                data = payload
-                params = {}
-
-        logger.debug(
-            "→ %s %s | params=%s | body_keys=%s",
-            method.upper(),
-            endpoint,
-            list(params.keys()) if params else [],
-            list(data.keys()) if data else [],
-        )
+                req_params, req_body = None, signed_query
+        else:
+            req_params = params if params else None
+            req_body = urlencode(data) if data else None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            if signed:
+                # Field names straight from the signed string, so templated
+                # and pre-encoded queries log timestamp/signature too.
+                keys = [f.partition("=")[0] for f in query.split("&")] + ["signature"]
+                param_keys, body_keys = (keys, []) if req_body is None else ([], keys)
+            else:
+                param_keys, body_keys = list(params), list(data)
+            logger.debug(
+                "→ %s %s | params=%s | body_keys=%s",
+                method.upper(),
+                endpoint,
+                param_keys,
+                body_keys,
+            )
 
         try:
             resp = self.session.request(
                 method=method,
                 url=url,
-                params=params if params else None,
-                data=urlencode(data) if data else None,
+                params=req_params,
+                data=req_body,
                 timeout=10,
             )
         except requests.exceptions.ConnectionError as exc:
@@ -128,10 +225,11 @@ class BinanceClient:
             logger.error("Request timed out: %s", exc)
             raise TimeoutError("Request to Binance timed out.") from exc
 
-        logger.debug("← HTTP %s | endpoint=%s", resp.status_code, endpoint)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("← HTTP %s | endpoint=%s", resp.status_code, endpoint)
 
         try:
-            body = resp.json()
+            body = _json_loads(resp.content)
         except ValueError:
             logger.error("Non-JSON response: %s", resp.text[:200])
             resp.raise_for_status()
@@ -189,27 +287,50 @@ class BinanceClient:
         symbol: str,
         side: str,
         order_type: str,
-        quantity: Decimal,
-        price: Optional[Decimal] = None,
-        stop_price: Optional[Decimal] = None,
+        quantity: Union[str, Decimal],
+        price: Optional[Union[str, Decimal]] = None,
+        stop_price: Optional[Union[str, Decimal]] = None,
         time_in_force: str = "GTC",
         reduce_only: bool = False,
     ) -> Dict[str, Any]:
 
-        data: Dict[str, Any] = {
-            "symbol": symbol,
-            "side": side,
-            "type": order_type,
-            "quantity": str(quantity),
-        }
+        qty = str(quantity)
+        px = None if price is None else str(price)
+
+        # Templates skip escaping, so only take them when no value needs it;
+        # anything else (spaces, '&', '+' in 1E+3, ...) goes via _fast_encode.
+        if (
+            stop_price is None
+            and order_type == "MARKET"
+            and _is_wire_safe(symbol, side, qty)
+        ):
+            query = _MARKET_TMPL.format(symbol=symbol, side=side, qty=qty)
+        elif (
+            stop_price is None
+            and order_type == "LIMIT"
+            and px is not None
+            and _is_wire_safe(symbol, side, time_in_force, qty, px)
+        ):
+            query = _LIMIT_TMPL.format(
+                symbol=symbol, side=side, tif=time_in_force, qty=qty, px=px
+            )
+        else:
+            pairs = [
+                ("symbol", symbol),
+                ("side", side),
+                ("type", order_type),
+                ("quantity", quantity),
+            ]
+
+            if order_type == "LIMIT":
+                pairs.append(("timeInForce", time_in_force))
+                if price is not None:
+                    pairs.append(("price", price))
 
-        if order_type == "LIMIT":
-            data["timeInForce"] = time_in_force
-            if price is not None:
-                data["price"] = str(price)
+            if stop_price is not None:
+                pairs.append(("stopPrice", stop_price))
 
-        if stop_price is not None:
-            data["stopPrice"] = str(stop_price)
+            query = _fast_encode(pairs)
 
         logger.info(
             "Placing %s %s order | symbol=%s qty=%s price=%s stopPrice=%s",
@@ -225,7 +346,7 @@ class BinanceClient:
             "POST",
             "/api/v3/order",
             signed=True,
-            data=data,
+            query=query,
         )
 
         logger.info(
@@ -238,9 +359,9 @@ class BinanceClient:
         return response
 
     def cancel_order(self, symbol: str, order_id: int) -> Dict[str, Any]:
-        data = {"symbol": symbol, "orderId": order_id}
+        query = _fast_encode((("symbol", symbol), ("orderId", order_id)))
         logger.info("Cancelling order | symbol=%s orderId=%s", symbol, order_id)
-        return self._request("DELETE", "/api/v3/order", signed=True, data=data)
+        return self._request("DELETE", "/api/v3/order", signed=True, query=query)
 
     def get_open_orders(self, symbol: Optional[str] = None) -> Any:
         params = {}
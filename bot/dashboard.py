@@ -5,15 +5,26 @@ Run with:
 streamlit run bot/dashboard.py
 """
 
+import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import plotly.graph_objects as go
 import requests
 from decimal import Decimal
 
 from client import BinanceClient
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional — fall back to the stdlib parser
+    json_loads = json.loads
+
 
 # ---------------------------------------------------
 # CONFIG
@@ -30,6 +41,7 @@ st.set_page_config(
 # CLIENT
 # ---------------------------------------------------
 
+@st.cache_resource
 def get_client():
     api_key = os.getenv("BINANCE_API_KEY", "")
     api_secret = os.getenv("BINANCE_API_SECRET", "")
@@ -39,52 +51,83 @@ def get_client():
 
 client = get_client()
 
+# Page data is fetched concurrently so a rerun waits on the slowest call,
+# not the sum of all of them. Cached so reruns share one pool.
+@st.cache_resource
+def get_executor():
+    return ThreadPoolExecutor(max_workers=4)
+
+
+executor = get_executor()
+
+
+def submit(fn):
+    """Run ``fn`` on the pool with this rerun's ScriptRunContext attached."""
+    ctx = get_script_run_ctx()
+
+    def run():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn()
+
+    return executor.submit(run)
+
 
 # ---------------------------------------------------
 # PRICE DATA
 # ---------------------------------------------------
 
+@st.cache_data(ttl=3, show_spinner=False)
 def get_price(symbol="BTCUSDT"):
     url = f"https://testnet.binance.vision/api/v3/ticker/price?symbol={symbol}"
-    return float(requests.get(url).json()["price"])
+    return float(json_loads(requests.get(url).content)["price"])
 
 
+@st.cache_data(ttl=10, show_spinner=False)
 def get_klines(symbol="BTCUSDT"):
     url = f"https://testnet.binance.vision/api/v3/klines"
     params = {"symbol": symbol, "interval": "1m", "limit": 100}
 
-    data = requests.get(url, params=params).json()
+    data = json_loads(requests.get(url, params=params).content)
 
-    df = pd.DataFrame(data, columns=[
-        "time", "open", "high", "low", "close", "volume",
-        "close_time", "qav", "num_trades", "taker_base",
-        "taker_quote", "ignore"
-    ])
+    if not data:
+        return pd.DataFrame({"time": pd.Series(dtype="datetime64[ns, UTC]"),
+                             "close": pd.Series(dtype=np.float64)})
 
-    df["close"] = df["close"].astype(float)
-    df["time"] = pd.to_datetime(df["time"], unit="ms")
+    # Only open time (col 0) and close (col 4) are charted — skip the rest.
+    raw = np.asarray(data, dtype=object)
+    time = pd.to_datetime(raw[:, 0].astype(np.int64), unit="ms", utc=True)
+    close = raw[:, 4].astype(np.float64)
 
-    return df
+    return pd.DataFrame({"time": time, "close": close})
 
 
 # ---------------------------------------------------
 # ACCOUNT
 # ---------------------------------------------------
 
+BALANCE_DTYPE = [("asset", "U16"), ("free", "f8"), ("locked", "f8")]
+
+
+@st.cache_data(ttl=5, show_spinner=False)
 def get_balances():
     account = client.get_account()
     balances = account.get("balances", [])
 
-    rows = []
-    for b in balances:
-        free = float(b["free"])
-        locked = float(b["locked"])
-        total = free + locked
-
-        if total > 0:
-            rows.append([b["asset"], free, locked, total])
-
-    df = pd.DataFrame(rows, columns=["Asset", "Free", "Locked", "Total"])
+    arr = np.fromiter(
+        ((b["asset"], float(b["free"]), float(b["locked"])) for b in balances),
+        dtype=BALANCE_DTYPE,
+        count=len(balances),
+    )
+
+    total = arr["free"] + arr["locked"]
+    mask = total > 0
+
+    df = pd.DataFrame({
+        "Asset": arr["asset"][mask],
+        "Free": arr["free"][mask],
+        "Locked": arr["locked"][mask],
+        "Total": total[mask],
+    })
     return df
 
 
@@ -92,40 +135,47 @@ def get_balances():
 # TRADE HISTORY (Mock using open orders)
 # ---------------------------------------------------
 
+@st.cache_data(ttl=5, show_spinner=False)
 def get_orders(symbol="BTCUSDT"):
     orders = client.get_open_orders(symbol)
 
     if not orders:
         return pd.DataFrame()
 
-    rows = []
-    for o in orders:
-        rows.append([
-            o["symbol"],
-            o["side"],
-            o["type"],
-            o["price"],
-            o["origQty"],
-            o["status"]
-        ])
-
-    return pd.DataFrame(rows, columns=[
-        "Symbol", "Side", "Type", "Price", "Qty", "Status"
-    ])
+    n = len(orders)
+    symbols = np.empty(n, dtype="U20")
+    sides = np.empty(n, dtype="U4")
+    types = np.empty(n, dtype="U20")
+    prices = np.empty(n, dtype=np.float64)
+    qtys = np.empty(n, dtype=np.float64)
+    statuses = np.empty(n, dtype="U20")
+
+    for i, o in enumerate(orders):
+        symbols[i] = o["symbol"]
+        sides[i] = o["side"]
+        types[i] = o["type"]
+        prices[i] = float(o["price"])
+        qtys[i] = float(o["origQty"])
+        statuses[i] = o["status"]
+
+    return pd.DataFrame({
+        "Symbol": symbols,
+        "Side": sides,
+        "Type": types,
+        "Price": prices,
+        "Qty": qtys,
+        "Status": statuses,
+    })
 
 
 # ---------------------------------------------------
 # PNL CALC
 # ---------------------------------------------------
 
-def calculate_pnl():
-    balances = get_balances()
-
+def calculate_pnl(balances, price):
     usdt = balances.loc[balances.Asset == "USDT", "Total"].sum()
     btc = balances.loc[balances.Asset == "BTC", "Total"].sum()
 
-    price = get_price()
-
     portfolio_value = usdt + btc * price
 
     return portfolio_value
@@ -137,15 +187,26 @@ def calculate_pnl():
 
 st.title("📈 Binance Trading Dashboard")
 
+futs = {
+    k: submit(fn)
+    for k, fn in [
+        ("price", get_price),
+        ("klines", get_klines),
+        ("balances", get_balances),
+        ("orders", get_orders),
+    ]
+}
+
 col1, col2, col3 = st.columns(3)
 
-price = get_price()
+price = futs["price"].result()
+balances = futs["balances"].result()
 
 with col1:
     st.metric("BTC Price", f"${price:,.2f}")
 
 with col2:
-    pnl = calculate_pnl()
+    pnl = calculate_pnl(balances, price)
     st.metric("Portfolio Value (USDT)", f"{pnl:,.2f}")
 
 with col3:
@@ -158,11 +219,12 @@ with col3:
 
 st.subheader("Live BTC Chart")
 
-df = get_klines()
+df = futs["klines"].result()
 
 fig = go.Figure()
 
-fig.add_trace(go.Scatter(
+# WebGL trace — stays responsive when the kline limit is raised to 1000+.
+fig.add_trace(go.Scattergl(
     x=df["time"],
     y=df["close"],
     mode="lines",
@@ -178,7 +240,6 @@ st.plotly_chart(fig, use_container_width=True)
 
 st.subheader("Account Balances")
 
-balances = get_balances()
 st.dataframe(balances, use_container_width=True)
 
 
@@ -188,7 +249,7 @@ st.dataframe(balances, use_container_width=True)
 
 st.subheader("Open Orders")
 
-orders = get_orders()
+orders = futs["orders"].result()
 st.dataframe(orders, use_container_width=True)
 
 
@@ -229,4 +290,5 @@ if st.button("Submit Order"):
 # REFRESH
 # ---------------------------------------------------
 
-st.button("Refresh")
+# Drop cached market/account data; the click's rerun then refetches it.
+st.button("Refresh", on_click=st.cache_data.clear)
@@ -3,44 +3,62 @@ Structured logging configuration for the Binance Futures Trading Bot.
 Outputs rich, human-readable logs to console and structured logs to file.
 """
 
+import functools
 import logging
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
 
 LOG_DIR = Path(__file__).parent.parent / "logs"
-LOG_DIR.mkdir(exist_ok=True)
 
 LOG_FILE = LOG_DIR / f"trading_bot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
 
 
+_GREY   = "\x1b[38;5;246m"
+_CYAN   = "\x1b[38;5;87m"
+_GREEN  = "\x1b[38;5;82m"
+_YELLOW = "\x1b[38;5;220m"
+_RED    = "\x1b[38;5;196m"
+_BOLD   = "\x1b[1m"
+_DIM    = "\x1b[2m"
+_RESET  = "\x1b[0m"
+
+
 class ColorFormatter(logging.Formatter):
     """ANSI-colored console formatter for a sleek terminal experience."""
 
-    GREY    = "\x1b[38;5;246m"
-    CYAN    = "\x1b[38;5;87m"
-    GREEN   = "\x1b[38;5;82m"
-    YELLOW  = "\x1b[38;5;220m"
-    RED     = "\x1b[38;5;196m"
-    BOLD    = "\x1b[1m"
-    DIM     = "\x1b[2m"
-    RESET   = "\x1b[0m"
-
-    LEVEL_COLORS = {
-        logging.DEBUG:    GREY,
-        logging.INFO:     CYAN,
-        logging.WARNING:  YELLOW,
-        logging.ERROR:    RED,
-        logging.CRITICAL: BOLD + RED,
-    }
+    GREY    = _GREY
+    CYAN    = _CYAN
+    GREEN   = _GREEN
+    YELLOW  = _YELLOW
+    RED     = _RED
+    BOLD    = _BOLD
+    DIM     = _DIM
+    RESET   = _RESET
+
+    # Indexed by levelno // 10: NOTSET, DEBUG, INFO, WARNING, ERROR, CRITICAL
+    LEVEL_COLORS = (GREY, GREY, CYAN, YELLOW, RED, BOLD + RED)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colored, padded level labels are fixed per level — build them once.
+        self._prefix = tuple(
+            f"{c}{logging.getLevelName(i * 10):<8}{_RESET}"
+            for i, c in enumerate(self.LEVEL_COLORS)
+        )
 
     def format(self, record: logging.LogRecord) -> str:
-        color = self.LEVEL_COLORS.get(record.levelno, self.GREY)
-        time_str = self.DIM + datetime.fromtimestamp(record.created).strftime("%H:%M:%S") + self.RESET
-        level_str = color + f"{record.levelname:<8}" + self.RESET
-        msg = record.getMessage()
-
-        if record.levelno >= logging.ERROR and record.exc_info:
+        time_str = _DIM + time.strftime("%H:%M:%S", time.localtime(record.created)) + _RESET
+        lvl = record.levelno
+        if lvl % 10 == 0 and 0 <= lvl <= logging.CRITICAL:
+            level_str = self._prefix[lvl // 10]
+        else:  # custom level: nearest standard color, its own name
+            color = self.LEVEL_COLORS[min(max(lvl, 0) // 10, len(self.LEVEL_COLORS) - 1)]
+            level_str = color + f"{record.levelname:<8}" + _RESET
+        msg = record.getMessage() if record.args else str(record.msg)
+
+        if lvl >= logging.ERROR and record.exc_info:
             msg += "\n" + self.formatException(record.exc_info)
 
         return f"{time_str}  {level_str}  {msg}"
@@ -53,6 +71,14 @@ class FileFormatter(logging.Formatter):
         return super().format(record)
 
 
+class _LazyFileHandler(logging.FileHandler):
+    """FileHandler that creates its log directory when the file is first opened."""
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(exist_ok=True)
+        return super()._open()
+
+
 def get_logger(name: str) -> logging.Logger:
     """Return a configured logger with both console and file handlers."""
     logger = logging.getLogger(name)
@@ -67,8 +93,10 @@ def get_logger(name: str) -> logging.Logger:
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(ColorFormatter())
 
-    # File handler — DEBUG and above, plain
-    file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+    # File handler — DEBUG and above, plain. Neither logs/ nor the file is
+    # created until the first record, so commands that never log (e.g.
+    # --help) leave nothing behind.
+    file_handler = _LazyFileHandler(LOG_FILE, encoding="utf-8", delay=True)
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(
         FileFormatter(
@@ -83,5 +111,6 @@ def get_logger(name: str) -> logging.Logger:
     return logger
 
 
+@functools.cache
 def get_log_file_path() -> Path:
     return LOG_FILE
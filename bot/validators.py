@@ -4,117 +4,208 @@ Raises descriptive errors for any invalid input before hitting the API.
 """
 
 from __future__ import annotations
+from functools import lru_cache
 from decimal import Decimal, InvalidOperation
-from typing import Optional
-import re
+from typing import Optional, Union
 
 
-VALID_SIDES = {"BUY", "SELL"}
-VALID_ORDER_TYPES = {"MARKET", "LIMIT", "STOP_MARKET", "STOP_LIMIT"}
-SYMBOL_PATTERN = re.compile(r"^[A-Z0-9]{3,20}$")
+VALID_SIDES = frozenset({"BUY", "SELL"})
+VALID_ORDER_TYPES = frozenset({"MARKET", "LIMIT", "STOP_MARKET", "STOP_LIMIT"})
+
+_PRICE_REQUIRED_TYPES = frozenset({"LIMIT", "STOP_LIMIT"})
+_STOP_REQUIRED_TYPES = frozenset({"STOP_MARKET", "STOP_LIMIT"})
+
+_VALID_SIDES_MSG = ", ".join(sorted(VALID_SIDES))
+_VALID_ORDER_TYPES_MSG = ", ".join(sorted(VALID_ORDER_TYPES))
+
+_SIDE_ERR = "Invalid side '%%s'. Must be one of: %s." % _VALID_SIDES_MSG
+_ORDER_TYPE_ERR = "Invalid order type '%%s'. Must be one of: %s." % _VALID_ORDER_TYPES_MSG
+_SYMBOL_ERR = "Invalid symbol '%s'. Expected uppercase alphanumeric (e.g. BTCUSDT)."
+_PRICE_REQUIRED_ERR = "Price is required for %s orders."
+_STOP_REQUIRED_ERR = "Stop price (--stop-price) is required for %s orders."
+
+# Numeric fields arrive as CLI text or as already-typed values. mypyc checks
+# annotations at runtime, so they must name every type the parser accepts.
+_Number = Union[str, int, float, Decimal]
 
 
 class ValidationError(Exception):
     """Raised when user-supplied input fails validation."""
 
+    __slots__ = ()
+
 
+def _is_symbol(s: str) -> bool:
+    """Equivalent to ``[A-Z0-9]{3,20}`` on an upper-cased string, without a regex engine."""
+    return 3 <= len(s) <= 20 and s.isascii() and s.isalnum()
+
+
+@lru_cache(maxsize=256, typed=True)
 def validate_symbol(symbol: str) -> str:
     """Ensure the symbol is a non-empty uppercase alphanumeric string."""
+    if _is_symbol(symbol) and (symbol.isupper() or symbol.isdigit()):
+        return symbol  # already canonical
     s = symbol.strip().upper()
-    if not SYMBOL_PATTERN.match(s):
-        raise ValidationError(
-            f"Invalid symbol '{symbol}'. Expected uppercase alphanumeric (e.g. BTCUSDT)."
-        )
+    if not _is_symbol(s):
+        raise ValidationError(_SYMBOL_ERR % (symbol,))
     return s
 
 
+@lru_cache(maxsize=256, typed=True)
 def validate_side(side: str) -> str:
     """Ensure side is BUY or SELL."""
+    if side in VALID_SIDES:
+        return side
     s = side.strip().upper()
     if s not in VALID_SIDES:
-        raise ValidationError(
-            f"Invalid side '{side}'. Must be one of: {', '.join(sorted(VALID_SIDES))}."
-        )
+        raise ValidationError(_SIDE_ERR % (side,))
     return s
 
 
+@lru_cache(maxsize=256, typed=True)
 def validate_order_type(order_type: str) -> str:
     """Ensure order type is one of the supported types."""
+    if order_type in VALID_ORDER_TYPES:
+        return order_type
     ot = order_type.strip().upper()
     if ot not in VALID_ORDER_TYPES:
+        raise ValidationError(_ORDER_TYPE_ERR % (order_type,))
+    return ot
+
+
+def _parse_positive_impl(value: object, field_name: str, strict: bool = False) -> Union[str, Decimal]:
+    """
+    Validate that ``value`` is a finite number greater than zero.
+
+    Returns the value as plain fixed-point text, which is what goes on the
+    wire (" .5" -> "0.5", "1E+3" -> "1000"), or as a Decimal with ``strict=True``.
+    """
+    if isinstance(value, Decimal):
+        d = value
+    else:
+        try:
+            d = Decimal(repr(value) if isinstance(value, float) else str(value))
+        except InvalidOperation:
+            d = Decimal("NaN")  # reported below like any other non-finite value
+    if not d.is_finite():
+        raise ValidationError(f"Invalid {field_name} '{value}'. Must be a positive number.")
+    if d <= 0:
         raise ValidationError(
-            f"Invalid order type '{order_type}'. Must be one of: {', '.join(sorted(VALID_ORDER_TYPES))}."
+            f"{field_name[0].upper()}{field_name[1:]} must be greater than zero, got: {d}."
         )
-    return ot
 
+    return d if strict else format(d, "f")
 
-def validate_quantity(quantity: str) -> Decimal:
-    """Parse and validate quantity — must be a positive number."""
-    try:
-        qty = Decimal(str(quantity))
-    except InvalidOperation:
-        raise ValidationError(f"Invalid quantity '{quantity}'. Must be a positive number.")
-    if qty <= 0:
-        raise ValidationError(f"Quantity must be greater than zero, got: {qty}.")
-    return qty
 
+_parse_positive_cached = lru_cache(maxsize=1024, typed=True)(_parse_positive_impl)
 
-def validate_price(price: Optional[str], order_type: str) -> Optional[Decimal]:
-    """Parse and validate price. Required for LIMIT and STOP_LIMIT orders."""
-    ot = order_type.strip().upper()
-    needs_price = ot in {"LIMIT", "STOP_LIMIT"}
 
-    if needs_price and (price is None or str(price).strip() == ""):
-        raise ValidationError(
-            f"Price is required for {ot} orders."
-        )
+def _parse_positive(value: object, field_name: str, strict: bool = False) -> Union[str, Decimal]:
+    # Only exact str inputs are memoized: equal Decimals such as 1 and 1.00
+    # share a cache key but must keep their own text, so they are parsed each time.
+    if type(value) is str:
+        return _parse_positive_cached(value, field_name, strict)
+    return _parse_positive_impl(value, field_name, strict)
+
+
+def validate_quantity(quantity: _Number, strict: bool = False) -> Union[str, Decimal]:
+    """Validate quantity — must be a positive number."""
+    return _parse_positive(quantity, "quantity", strict)
+
+
+def validate_price(
+    price: Optional[_Number], order_type: str, strict: bool = False
+) -> Optional[Union[str, Decimal]]:
+    """
+    Parse and validate price. Required for LIMIT and STOP_LIMIT orders.
+
+    ``order_type`` must already be canonical (as returned by validate_order_type).
+    """
+    if order_type not in VALID_ORDER_TYPES:  # e.g. a raw "limit" from a stale caller
+        raise ValidationError(_ORDER_TYPE_ERR % (order_type,))
     if price is None or str(price).strip() == "":
+        if order_type in _PRICE_REQUIRED_TYPES:
+            raise ValidationError(_PRICE_REQUIRED_ERR % (order_type,))
         return None
 
-    try:
-        p = Decimal(str(price))
-    except InvalidOperation:
-        raise ValidationError(f"Invalid price '{price}'. Must be a positive number.")
-    if p <= 0:
-        raise ValidationError(f"Price must be greater than zero, got: {p}.")
-    return p
+    return _parse_positive(price, "price", strict)
 
 
-def validate_stop_price(stop_price: Optional[str], order_type: str) -> Optional[Decimal]:
-    """Parse and validate stop price. Required for STOP_MARKET and STOP_LIMIT orders."""
-    ot = order_type.strip().upper()
-    needs_stop = ot in {"STOP_MARKET", "STOP_LIMIT"}
+def validate_stop_price(
+    stop_price: Optional[_Number], order_type: str, strict: bool = False
+) -> Optional[Union[str, Decimal]]:
+    """
+    Parse and validate stop price. Required for STOP_MARKET and STOP_LIMIT orders.
 
-    if needs_stop and (stop_price is None or str(stop_price).strip() == ""):
-        raise ValidationError(
-            f"Stop price (--stop-price) is required for {ot} orders."
-        )
+    ``order_type`` must already be canonical (as returned by validate_order_type).
+    """
+    if order_type not in VALID_ORDER_TYPES:  # e.g. a raw "limit" from a stale caller
+        raise ValidationError(_ORDER_TYPE_ERR % (order_type,))
     if stop_price is None or str(stop_price).strip() == "":
+        if order_type in _STOP_REQUIRED_TYPES:
+            raise ValidationError(_STOP_REQUIRED_ERR % (order_type,))
         return None
 
-    try:
-        sp = Decimal(str(stop_price))
-    except InvalidOperation:
-        raise ValidationError(f"Invalid stop price '{stop_price}'. Must be a positive number.")
-    if sp <= 0:
-        raise ValidationError(f"Stop price must be greater than zero, got: {sp}.")
-    return sp
+    return _parse_positive(stop_price, "stop price", strict)
+
+
+def cache_clear() -> None:
+    """Flush the memoized results of all component validators."""
+    for fn in (validate_symbol, validate_side, validate_order_type,
+               _parse_positive_cached):
+        fn.cache_clear()
 
 
 def validate_all(
     symbol: str,
     side: str,
     order_type: str,
-    quantity: str,
-    price: Optional[str] = None,
-    stop_price: Optional[str] = None,
+    quantity: _Number,
+    price: Optional[_Number] = None,
+    stop_price: Optional[_Number] = None,
+    strict: bool = False,
 ) -> dict:
-    """Run all validations and return a clean, typed parameter dict."""
+    """
+    Run all validations and return a clean parameter dict.
+
+    Numeric fields come back as their validated wire strings, or as Decimals
+    when ``strict=True``.
+    """
+    # Inlined so a valid order runs in this one Python frame: the lru_cache
+    # wrappers for symbol/side/type and numeric strings answer hits in C, the
+    # order type is normalized once, and the price checks skip the canonical
+    # order type guard that validate_price/validate_stop_price need.
+    sym = validate_symbol(symbol)
+    sd = validate_side(side)
+    ot = validate_order_type(order_type)
+
+    qty = (_parse_positive_cached if type(quantity) is str else _parse_positive_impl)(
+        quantity, "quantity", strict
+    )
+
+    if price is None or str(price).strip() == "":
+        if ot in _PRICE_REQUIRED_TYPES:
+            raise ValidationError(_PRICE_REQUIRED_ERR % (ot,))
+        px = None
+    else:
+        px = (_parse_positive_cached if type(price) is str else _parse_positive_impl)(
+            price, "price", strict
+        )
+
+    if stop_price is None or str(stop_price).strip() == "":
+        if ot in _STOP_REQUIRED_TYPES:
+            raise ValidationError(_STOP_REQUIRED_ERR % (ot,))
+        sp = None
+    else:
+        sp = (_parse_positive_cached if type(stop_price) is str else _parse_positive_impl)(
+            stop_price, "stop price", strict
+        )
+
     return {
-        "symbol":     validate_symbol(symbol),
-        "side":       validate_side(side),
-        "order_type": validate_order_type(order_type),
-        "quantity":   validate_quantity(quantity),
-        "price":      validate_price(price, order_type),
-        "stop_price": validate_stop_price(stop_price, order_type),
+        "symbol":     sym,
+        "side":       sd,
+        "order_type": ot,
+        "quantity":   qty,
+        "price":      px,
+        "stop_price": sp,
     }
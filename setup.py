@@ -0,0 +1,26 @@
+"""
+Optional native build for the validation layer.
+
+Compiles ``bot/validators.py`` to a C extension with mypyc:
+
+    pip install mypy
+    python setup.py build_ext --inplace
+
+Without mypyc installed, the pure-Python module is used unchanged.
+"""
+
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = mypycify(["bot/validators.py"])
+
+setup(
+    name="trading-bot",
+    version="1.0.0",
+    packages=["bot"],
+    ext_modules=ext_modules,
+)
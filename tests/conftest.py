@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# bot/client.py imports its siblings script-style (``from logging_config
+# import ...``), as run from the dashboard, so put bot/ on the path too.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bot"))
@@ -0,0 +1,81 @@
+import pytest
+
+pytest.importorskip("pandas")
+
+import itertools  # noqa: E402
+from decimal import Decimal  # noqa: E402
+
+from bot.batch_validators import validate_all_batch  # noqa: E402
+from bot.validators import ValidationError, validate_all  # noqa: E402
+
+
+def test_batch_valid_rows():
+    out = validate_all_batch(
+        ["btcusdt", " ETHUSDT"],
+        ["buy", "SELL"],
+        ["limit", "stop_market"],
+        ["0.1", "2"],
+        ["100", None],
+        [None, " 5 "],
+    )
+
+    assert out["symbol"].tolist() == ["BTCUSDT", "ETHUSDT"]
+    assert out["side"].tolist() == ["BUY", "SELL"]
+    assert out["order_type"].tolist() == ["LIMIT", "STOP_MARKET"]
+    assert out["quantity"].tolist() == ["0.1", "2"]
+    assert out["price"].tolist() == ["100", None]
+    assert out["stop_price"].tolist() == [None, "5"]
+
+
+@pytest.mark.parametrize("kwargs, message", [
+    (dict(symbols=["BTCUSDT", "b!"]), r"Rows \[1\]: invalid symbol"),
+    (dict(sides=["BUY", "hold"]), r"Rows \[1\]: invalid side"),
+    (dict(quantities=["1", "abc"]), r"Rows \[1\]: invalid quantity"),
+    (dict(quantities=["-1", ""]), r"Rows \[1\]: quantity is required"),
+    (dict(order_types=["MARKET", "LIMIT"]), r"Rows \[1\]: price is required"),
+    (dict(order_types=["STOP_LIMIT", "MARKET"], prices=["1", None]),
+     r"Rows \[0\]: stop price is required"),
+])
+def test_batch_bad_rows(kwargs, message):
+    args = dict(
+        symbols=["BTCUSDT", "ETHUSDT"],
+        sides=["BUY", "SELL"],
+        order_types=["MARKET", "MARKET"],
+        quantities=["1", "1"],
+    )
+    args.update(kwargs)
+    with pytest.raises(ValidationError, match=message):
+        validate_all_batch(**args)
+
+
+def test_batch_length_mismatch_is_reported_before_row_errors():
+    with pytest.raises(ValidationError, match="sides must have the same length"):
+        validate_all_batch(["BTCUSDT", "ETHUSDT"], ["hold"], ["MARKET", "MARKET"], ["1", "1"])
+
+
+_NUMBERS = [None, "", "1", " 0.5 ", "00.5", "0.000", ".5", "5.", "+1", "-1", "1e3",
+            "1e-05", "١٢", "inf", "nan", "abc", Decimal("1E+3"), 1e-05]
+
+
+def _single(*args):
+    try:
+        return validate_all(*args)
+    except ValidationError:
+        return None
+
+
+def _batch(*args):
+    try:
+        out = validate_all_batch(*([a] for a in args))
+    except ValidationError:
+        return None
+    return {k: v[0] for k, v in out.items()}
+
+
+def test_batch_agrees_with_validate_all_row_by_row():
+    grid = itertools.product(
+        [" btcusdt", "x!"], ["sell"], ["market", "stop_limit"],
+        _NUMBERS, _NUMBERS[:5] + ["-2", "1e3"], [None, "2"],
+    )
+    for args in grid:
+        assert _batch(*args) == _single(*args), args
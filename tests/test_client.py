@@ -0,0 +1,74 @@
+import hashlib
+import hmac
+from decimal import Decimal
+from urllib.parse import parse_qsl, urlencode
+
+import pytest
+
+pytest.importorskip("requests")
+
+import client  # noqa: E402  (bot/ is put on sys.path by conftest.py)
+from client import BinanceClient  # noqa: E402
+
+SECRET = "s3cret"
+TIMESTAMP = 1_700_000_000_000
+
+
+class _Response:
+    status_code = 200
+    content = b'{"orderId": 1, "status": "NEW", "executedQty": "0"}'
+    text = content.decode()
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """A client whose outgoing requests are recorded instead of sent."""
+    monkeypatch.setattr(client.logger, "handlers", [])
+    calls = []
+    bc = BinanceClient("key", SECRET)
+    bc._timestamp = lambda: TIMESTAMP
+    bc.session.request = lambda **kw: calls.append(kw) or _Response()
+    return bc, calls
+
+
+def _split_signed(raw: bytes):
+    query, _, signature = raw.rpartition(b"&signature=")
+    expected = hmac.new(SECRET.encode(), query, hashlib.sha256).hexdigest()
+    assert signature.decode() == expected
+    return parse_qsl(query.decode(), strict_parsing=True)
+
+
+@pytest.mark.parametrize("order_type, price", [("MARKET", None), ("LIMIT", Decimal("2"))])
+def test_place_order_escapes_unsafe_values(sent, order_type, price):
+    bc, calls = sent
+
+    bc.place_order("BTC USDT&side=SELL", "BUY", order_type, Decimal("1E+3"), price)
+
+    fields = _split_signed(calls[0]["data"])
+    assert [k for k, _ in fields].count("side") == 1
+    fields = dict(fields)
+    assert fields["symbol"] == "BTC USDT&side=SELL"
+    assert fields["side"] == "BUY"
+    assert fields["quantity"] == "1E+3"
+    assert fields["timestamp"] == str(TIMESTAMP)
+
+
+def test_place_order_template_matches_encoded_pairs(sent):
+    bc, calls = sent
+
+    bc.place_order("BTCUSDT", "SELL", "LIMIT", "0.5", "30000")
+
+    assert _split_signed(calls[0]["data"]) == [
+        ("symbol", "BTCUSDT"), ("side", "SELL"), ("type", "LIMIT"),
+        ("timeInForce", "GTC"), ("quantity", "0.5"), ("price", "30000"),
+        ("timestamp", str(TIMESTAMP)), ("recvWindow", str(client.RECV_WINDOW)),
+    ]
+
+
+@pytest.mark.parametrize("pairs", [
+    [("symbol", "BTCUSDT"), ("quantity", Decimal("0.5")), ("orderId", 42)],
+    [("symbol", "BTC USDT&side=SELL"), ("quantity", Decimal("1E+3"))],
+    [("note", "a=b%c/d~e_f.g-h"), ("unicode", "é")],
+])
+def test_fast_encode_matches_urlencode(pairs):
+    assert client._fast_encode(pairs) == urlencode(pairs)
@@ -0,0 +1,118 @@
+from decimal import Decimal
+
+import pytest
+
+from bot.validators import (
+    ValidationError,
+    _parse_positive_cached,
+    cache_clear,
+    validate_all,
+    validate_price,
+    validate_quantity,
+    validate_stop_price,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    cache_clear()
+    yield
+    cache_clear()
+
+
+def test_cache_does_not_conflate_equal_values_of_different_types():
+    assert validate_quantity(1.0) == "1.0"
+    with pytest.raises(ValidationError):
+        validate_quantity(True)
+
+
+def test_strict_cache_keeps_decimal_exponent():
+    assert str(validate_quantity(Decimal("1"), strict=True)) == "1"
+    assert str(validate_quantity(Decimal("1.00"), strict=True)) == "1.00"
+
+
+def test_cached_string_parse_is_reused():
+    validate_quantity("0.5")
+    validate_quantity("0.5")
+    assert _parse_positive_cached.cache_info().hits == 1
+
+
+def _order(symbol, side, order_type, quantity, price=None, stop_price=None):
+    return {"symbol": symbol, "side": side, "order_type": order_type,
+            "quantity": quantity, "price": price, "stop_price": stop_price}
+
+
+@pytest.mark.parametrize("args, expected", [
+    (("btcusdt", "buy", "market", "1"), _order("BTCUSDT", "BUY", "MARKET", "1")),
+    ((" ethusdt ", "Sell", "limit", " .5 ", "30000.00", ""),
+     _order("ETHUSDT", "SELL", "LIMIT", "0.5", "30000.00")),
+    (("BTCUSDT", "BUY", "stop_limit", "1", "10", "9"),
+     _order("BTCUSDT", "BUY", "STOP_LIMIT", "1", "10", "9")),
+    (("BTCUSDT", "BUY", "STOP_MARKET", 2, None, "1E+1"),
+     _order("BTCUSDT", "BUY", "STOP_MARKET", "2", None, "10")),
+    (("BTCUSDT", "BUY", "LIMIT", Decimal("1.00"), "2", None, True),
+     _order("BTCUSDT", "BUY", "LIMIT", Decimal("1.00"), Decimal("2"))),
+])
+def test_validate_all_returns_clean_params(args, expected):
+    result = validate_all(*args)
+    assert result == expected
+    assert [type(v) for v in result.values()] == [type(v) for v in expected.values()]
+
+
+@pytest.mark.parametrize("args, message", [
+    # Checked in order: symbol, side, order type, quantity, price, stop price.
+    (("x!", "hold", "bad", "-1"),
+     "Invalid symbol 'x!'. Expected uppercase alphanumeric (e.g. BTCUSDT)."),
+    (("BTCUSDT", "hold", "bad", "-1"), "Invalid side 'hold'. Must be one of: BUY, SELL."),
+    (("BTCUSDT", "BUY", "bad", "-1"),
+     "Invalid order type 'bad'. Must be one of: LIMIT, MARKET, STOP_LIMIT, STOP_MARKET."),
+    (("BTCUSDT", "BUY", "LIMIT", "x"), "Invalid quantity 'x'. Must be a positive number."),
+    (("BTCUSDT", "BUY", "MARKET", "-1"), "Quantity must be greater than zero, got: -1."),
+    (("BTCUSDT", "BUY", "limit", "1", " "), "Price is required for LIMIT orders."),
+    (("BTCUSDT", "BUY", "MARKET", "1", "abc"), "Invalid price 'abc'. Must be a positive number."),
+    (("BTCUSDT", "BUY", "STOP_LIMIT", "1", "1"),
+     "Stop price (--stop-price) is required for STOP_LIMIT orders."),
+    (("BTCUSDT", "BUY", "MARKET", "1", None, "0"), "Stop price must be greater than zero, got: 0."),
+])
+def test_validate_all_errors(args, message):
+    with pytest.raises(ValidationError) as exc_info:
+        validate_all(*args)
+    assert str(exc_info.value) == message
+
+
+@pytest.mark.parametrize("fn", [validate_price, validate_stop_price])
+def test_price_validators_reject_non_canonical_order_type(fn):
+    with pytest.raises(ValidationError, match="Invalid order type 'limit'"):
+        fn(None, "limit")
+
+
+@pytest.mark.parametrize("strict", [False, True])
+@pytest.mark.parametrize("raw", ["inf", "-inf", "nan", "sNaN", "", "abc", "1,000", "0x10"])
+def test_quantity_rejects_non_numeric_text(raw, strict):
+    with pytest.raises(ValidationError, match="Must be a positive number"):
+        validate_quantity(raw, strict)
+
+
+@pytest.mark.parametrize("strict", [False, True])
+@pytest.mark.parametrize("raw", ["0", "-1", "-0.5", "0E+3"])
+def test_quantity_rejects_non_positive(raw, strict):
+    with pytest.raises(ValidationError, match="must be greater than zero"):
+        validate_quantity(raw, strict)
+
+
+@pytest.mark.parametrize("raw, wire", [
+    (" 0.5 ", "0.5"),
+    ("10", "10"),
+    (".5", "0.5"),
+    ("5.", "5"),
+    ("+1", "1"),
+    ("00.5", "0.5"),
+    ("1e3", "1000"),
+    ("١٢", "12"),
+    (Decimal("1E+3"), "1000"),
+    (5, "5"),
+    (1e-05, "0.00001"),
+])
+def test_quantity_normalizes_to_plain_wire_text(raw, wire):
+    assert validate_quantity(raw) == wire
+    assert validate_quantity(raw, strict=True) == Decimal(wire)